@@ -16,6 +16,11 @@ setup(
         "dash-bootstrap-components>=1.5.0",
         "ccxt>=4.2.15",
         "pytest>=8.0.0",
-        "python-binance>=1.0.19"
+        "python-binance>=1.0.19",
+        "bottleneck>=1.3.7",
+        "numexpr>=2.9.0",
+        "numba>=0.59.0",
+        "httpx[http2]>=0.27.0",
+        "orjson>=3.8.3"
     ],
 ) 
\ No newline at end of file
@@ -1,11 +1,83 @@
 import pandas as pd
 import numpy as np
+from math import fabs
+import bottleneck as bn
+import numexpr as ne
+from numba import njit
 from enum import Enum
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
 from dataclasses import dataclass
 
+@njit(cache=True, fastmath=True)
+def _move_mean_std(values, window, ddof):
+    """Single fused pass computing rolling mean and std of a 1-D array.
+
+    Maintains running sum/sum-of-squares accumulators so each element is
+    read once, instead of making separate rolling passes for each statistic.
+    Windows shorter than `window` are computed from the bars seen so far
+    (min_count=1 semantics); std is NaN while count <= ddof.
+    """
+    n = values.shape[0]
+    mean = np.empty(n)
+    std = np.empty(n)
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        x = values[i]
+        total += x
+        total_sq += x * x
+        if i >= window:
+            old = values[i - window]
+            total -= old
+            total_sq -= old * old
+        count = i + 1 if i < window else window
+        mean[i] = total / count
+        if count > ddof:
+            var = (total_sq - total * total / count) / (count - ddof)
+            std[i] = np.sqrt(var) if var > 0.0 else 0.0
+        else:
+            std[i] = np.nan
+    return mean, std
+
+def _safe_move_mean(values: np.ndarray, window: int, min_count: Optional[int] = None) -> np.ndarray:
+    """bn.move_mean with pandas rolling semantics on short inputs.
+
+    bottleneck raises when the window exceeds the array length, where the
+    pandas rolling it replaced returned all-NaN (or partial means under
+    min_periods). NaN-fill, or clamp the window when min_count allows
+    partial windows, instead of raising.
+    """
+    n = values.shape[0]
+    if n >= window:
+        return bn.move_mean(values, window, min_count=min_count)
+    if min_count is None or n == 0:
+        return np.full(n, np.nan)
+    return bn.move_mean(values, n, min_count=min_count)
+
+def _safe_move_std(values: np.ndarray, window: int, ddof: int) -> np.ndarray:
+    """bn.move_std that NaN-fills instead of raising on short inputs."""
+    if values.shape[0] >= window:
+        return bn.move_std(values, window, ddof=ddof)
+    return np.full(values.shape[0], np.nan)
+
+def _ewm_last(values: np.ndarray, span: int) -> float:
+    """Last value of an adjust=True exponential moving average."""
+    alpha = 2.0 / (span + 1.0)
+    weights = np.power(1.0 - alpha, np.arange(values.shape[0] - 1, -1, -1))
+    return float(np.dot(weights, values) / weights.sum())
+
 class MarketRegime(Enum):
     """Market regime classification."""
+
+    def __new__(cls, value):
+        obj = object.__new__(cls)
+        obj._value_ = value
+        # Stable ordinal (definition order) so callers can index flat
+        # lookup tables instead of hashing the member; the string value
+        # stays as-is for prompts and logs
+        obj.index = len(cls.__members__)
+        return obj
+
     TRENDING_UP = "trending_up"
     TRENDING_DOWN = "trending_down"
     RANGING_LOW_VOL = "ranging_low_vol"
@@ -54,200 +126,314 @@ class MarketRegimeDetector:
         self.momentum_lookback = momentum_lookback
         self.transition_memory = transition_memory
         self.regime_history: List[RegimeTransition] = []
-        
-    def _calculate_trend_strength(self, df: pd.DataFrame) -> Tuple[float, float]:
+        self._scratch_bufs: Dict[str, np.ndarray] = {}
+
+    def _scratch(self, name: str, n: int) -> np.ndarray:
+        """Return a reusable float64 scratch buffer of length n.
+
+        The detector is long-lived and runs once per decision; keeping the
+        shift/diff work arrays on the instance avoids re-allocating N-sized
+        temporaries on every call.
+        """
+        buf = self._scratch_bufs.get(name)
+        if buf is None or buf.shape[0] != n:
+            buf = np.empty(n, dtype=np.float64)
+            self._scratch_bufs[name] = buf
+        return buf
+        
+    def _compute_shared_features(self, df: pd.DataFrame) -> Dict:
+        """Extract the OHLCV ndarrays consumed by the per-timeframe helpers.
+
+        detect_regime runs several helpers over the same frame; pulling the
+        columns out once avoids repeated column lookups and Series-to-ndarray
+        conversions on the per-decision path.
+        """
+        return {
+            'open': df['open'].to_numpy(dtype=np.float64),
+            'high': df['high'].to_numpy(dtype=np.float64),
+            'low': df['low'].to_numpy(dtype=np.float64),
+            'close': df['close'].to_numpy(dtype=np.float64),
+            'volume': df['volume'].to_numpy(dtype=np.float64)
+        }
+
+    def _calculate_trend_strength(self, df: pd.DataFrame,
+                                  features: Optional[Dict] = None) -> Tuple[float, float]:
         """Calculate trend strength using multiple indicators.
-        
+
         Returns:
             Tuple[float, float]: (trend_strength, trend_direction)
             trend_strength: 0.0 to 1.0 (stronger trend)
             trend_direction: -1.0 to 1.0 (down to up)
         """
-        # Calculate EMAs
-        ema20 = df['close'].ewm(span=20).mean()
-        ema50 = df['close'].ewm(span=50).mean()
-        
-        # ADX for trend strength
-        high_low = df['high'] - df['low']
-        high_close = np.abs(df['high'] - df['close'].shift())
-        low_close = np.abs(df['low'] - df['close'].shift())
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = tr.rolling(14).mean()
-        
-        up_move = df['high'] - df['high'].shift()
-        down_move = df['low'].shift() - df['low']
-        
-        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
-        
-        plus_di = 100 * pd.Series(plus_dm).rolling(14).mean() / atr
-        minus_di = 100 * pd.Series(minus_dm).rolling(14).mean() / atr
-        
-        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(14).mean()
-        
+        if features is None:
+            features = self._compute_shared_features(df)
+
+        high = features['high']
+        low = features['low']
+        close = features['close']
+        prev_close = self._scratch('prev_close', close.shape[0])
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+
+        # ADX for trend strength; np.fmax keeps pandas' skipna row-max
+        # semantics for the first bar (NaN previous close) without
+        # materializing a 3-column DataFrame for the reduction
+        high_low = high - low
+        high_close = np.abs(high - prev_close)
+        low_close = np.abs(low - prev_close)
+        tr = np.fmax(high_low, np.fmax(high_close, low_close))
+        atr = _safe_move_mean(tr, 14)
+
+        up_move = self._scratch('up_move', high.shape[0])
+        up_move[0] = np.nan
+        np.subtract(high[1:], high[:-1], out=up_move[1:])
+        down_move = self._scratch('down_move', low.shape[0])
+        down_move[0] = np.nan
+        np.subtract(low[:-1], low[1:], out=down_move[1:])
+
+        # Fuse the directional-movement masks into a single numexpr pass
+        # instead of materializing each comparison as its own temporary
+        plus_dm = ne.evaluate("where((up_move > down_move) & (up_move > 0), up_move, 0)")
+        minus_dm = ne.evaluate("where((down_move > up_move) & (down_move > 0), down_move, 0)")
+        
+        # Everything below stays on the ndarrays: bottleneck moving means
+        # replace the Series round-trips the DI/ADX chain used to make
+        with np.errstate(invalid='ignore', divide='ignore'):
+            plus_di = 100 * _safe_move_mean(plus_dm, 14) / atr
+            minus_di = 100 * _safe_move_mean(minus_dm, 14) / atr
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        adx = _safe_move_mean(dx, 14)
+
         # Combine indicators for trend strength and direction
-        trend_strength = min(1.0, adx.iloc[-1] / 100)
-        
-        # Trend direction from EMAs and DI
-        ema_direction = 1 if ema20.iloc[-1] > ema50.iloc[-1] else -1
-        di_direction = 1 if plus_di.iloc[-1] > minus_di.iloc[-1] else -1
+        trend_strength = min(1.0, adx[-1] / 100)
+
+        # Trend direction from EMAs and DI (only the trailing EMA values
+        # are consumed, so compute them directly from the close array)
+        ema_direction = 1 if _ewm_last(close, 20) > _ewm_last(close, 50) else -1
+        di_direction = 1 if plus_di[-1] > minus_di[-1] else -1
         trend_direction = ema_direction if ema_direction == di_direction else 0
         
         return trend_strength, trend_direction
         
-    def _detect_volatility_regime(self, df: pd.DataFrame) -> Tuple[bool, float]:
+    def _detect_volatility_regime(self, df: pd.DataFrame,
+                                  features: Optional[Dict] = None) -> Tuple[bool, float]:
         """Detect if we're in a high volatility regime.
-        
+
         Returns:
             Tuple[bool, float]: (is_high_vol, vol_percentile)
         """
-        # Calculate historical volatility
-        returns = np.log(df['close'] / df['close'].shift(1))
-        rolling_std = returns.rolling(self.vol_window).std() * np.sqrt(252)
-        
+        if features is None:
+            features = self._compute_shared_features(df)
+
+        # Calculate historical volatility (bottleneck moving std over the
+        # log-return array instead of a pandas rolling invocation)
+        closes = features['close']
+        returns = np.log(closes[1:] / closes[:-1])
+        rolling_std = _safe_move_std(returns, self.vol_window, 1) * np.sqrt(252)
+
+        # Not enough history for a single window: NaN percentile, low vol,
+        # matching what the NaN-filled pandas rolling produced
+        if np.isnan(rolling_std).all():
+            return False, np.nan
+
         # Get current volatility percentile
-        vol_percentile = (rolling_std.iloc[-1] - rolling_std.min()) / (rolling_std.max() - rolling_std.min())
+        vol_min = np.nanmin(rolling_std)
+        vol_max = np.nanmax(rolling_std)
+        vol_percentile = (rolling_std[-1] - vol_min) / (vol_max - vol_min)
         is_high_vol = vol_percentile > 0.7
-        
+
         return is_high_vol, vol_percentile
         
-    def _detect_breakout(self, df: pd.DataFrame) -> Tuple[bool, float]:
+    def _detect_breakout(self, df: pd.DataFrame,
+                         features: Optional[Dict] = None) -> Tuple[bool, float]:
         """Detect if we're in a breakout.
-        
+
         Returns:
             Tuple[bool, float]: (is_breakout, breakout_strength)
         """
-        # Calculate Bollinger Bands
-        rolling_mean = df['close'].rolling(self.trend_window).mean()
-        rolling_std = df['close'].rolling(self.trend_window).std()
-        
-        upper_band = rolling_mean + (rolling_std * self.breakout_std)
-        lower_band = rolling_mean - (rolling_std * self.breakout_std)
-        
+        if features is None:
+            features = self._compute_shared_features(df)
+
+        # Calculate Bollinger Bands; only the latest band values are ever
+        # consumed, so compute the last window's mean/std directly instead
+        # of rolling arrays over the full history
+        closes = features['close']
+        if closes.shape[0] < self.trend_window:
+            # The rolling bands this replaced were NaN until a full window
+            # accumulated, so short frames never signalled a breakout;
+            # keep that rather than banding a partial window
+            return False, 0.0
+        window = closes[-self.trend_window:]
+        mean_last = window.mean()
+        std_last = window.std(ddof=1)
+
+        upper_band = mean_last + (std_last * self.breakout_std)
+        lower_band = mean_last - (std_last * self.breakout_std)
+
         # Check if price is outside bands
-        current_price = df['close'].iloc[-1]
-        is_breakout = current_price > upper_band.iloc[-1] or current_price < lower_band.iloc[-1]
-        
+        current_price = closes[-1]
+        is_breakout = current_price > upper_band or current_price < lower_band
+
         # Calculate breakout strength
         if is_breakout:
-            if current_price > upper_band.iloc[-1]:
-                strength = (current_price - upper_band.iloc[-1]) / rolling_std.iloc[-1]
+            if current_price > upper_band:
+                strength = (current_price - upper_band) / std_last
             else:
-                strength = (lower_band.iloc[-1] - current_price) / rolling_std.iloc[-1]
+                strength = (lower_band - current_price) / std_last
         else:
             strength = 0.0
             
         return is_breakout, min(1.0, strength / 2)
         
-    def _calculate_momentum(self, df: pd.DataFrame) -> Tuple[float, float]:
+    def _calculate_momentum(self, df: pd.DataFrame,
+                            features: Optional[Dict] = None) -> Tuple[float, float]:
         """Calculate momentum using rate of change and volume.
-        
+
         Returns:
             Tuple[float, float]: (momentum_strength, momentum_direction)
             momentum_strength: 0.0 to 1.0 (stronger momentum)
             momentum_direction: -1.0 to 1.0 (down to up)
         """
-        # Rate of change momentum
-        roc = df['close'].pct_change(self.momentum_lookback)
-        
+        if features is None:
+            features = self._compute_shared_features(df)
+
+        # Only the latest values are consumed, so everything is computed
+        # from ndarray tails - no full-length pandas columns, no df writes
+        closes = features['close']
+        volumes = features['volume']
+
+        # Rate of change momentum (NaN, like pct_change, when there isn't
+        # enough history to look back)
+        if closes.shape[0] > self.momentum_lookback:
+            roc_last = closes[-1] / closes[-1 - self.momentum_lookback] - 1.0
+        else:
+            roc_last = np.nan
+
         # Volume-weighted momentum
-        vol_roc = df['volume'].pct_change(self.momentum_lookback)
-        rel_vol = df['volume'] / df['volume'].rolling(50).mean()
-        
-        # RSI for overbought/oversold
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
+        rel_vol_last = volumes[-1] / volumes[-50:].mean()
+
+        # RSI for overbought/oversold over the last 14 close deltas;
+        # (|d|+d)/2 and (|d|-d)/2 are the branchless positive/negative
+        # parts, avoiding the select-both-branches np.where pattern
+        delta = np.diff(closes[-15:])
+        abs_delta = np.abs(delta)
+        gain = ((abs_delta + delta) * 0.5).mean()
+        loss = ((abs_delta - delta) * 0.5).mean()
+        if loss > 0.0:
+            rsi_last = 100.0 - 100.0 / (1.0 + gain / loss)
+        else:
+            rsi_last = 100.0 if gain > 0.0 else 50.0
+
         # Combine indicators
-        mom_direction = np.sign(roc.iloc[-1])
-        mom_strength = min(1.0, abs(roc.iloc[-1]) * (1 + rel_vol.iloc[-1]) / 2)
-        
+        mom_direction = np.sign(roc_last)
+        mom_strength = min(1.0, fabs(roc_last) * (1 + rel_vol_last) / 2)
+
         # Adjust for overbought/oversold
-        if rsi.iloc[-1] > 70:
+        if rsi_last > 70:
             mom_strength *= 0.7  # Reduce momentum in overbought
-        elif rsi.iloc[-1] < 30:
+        elif rsi_last < 30:
             mom_strength *= 0.7  # Reduce momentum in oversold
-            
+
         return mom_strength, mom_direction
         
-    def _analyze_volume_profile(self, df: pd.DataFrame) -> Dict:
+    def _analyze_volume_profile(self, df: pd.DataFrame,
+                                features: Optional[Dict] = None) -> Dict:
         """Analyze volume profile for accumulation/distribution patterns.
-        
+
         Returns:
             Dict with volume analysis metrics
         """
-        # Calculate volume metrics
-        vol_sma = df['volume'].rolling(20).mean()
-        vol_std = df['volume'].rolling(20).std()
-        rel_vol = df['volume'] / vol_sma
-        
-        # Detect volume trends
-        vol_trend = df['volume'].rolling(10).mean().diff()
-        vol_trend_strength = abs(vol_trend.mean() / vol_std.mean())
-        
+        if features is None:
+            features = self._compute_shared_features(df)
+
+        # Calculate volume metrics in one fused numba pass (mean and std
+        # share the running accumulators instead of two separate kernels)
+        volume = features['volume']
+        vol_sma, vol_std = _move_mean_std(volume, 20, 1)
+        rel_vol_last = volume[-1] / vol_sma[-1]
+
+        # Detect volume trends: the diff of a 10-bar moving average is just
+        # the scaled difference of bars 10 apart, so one subtraction over
+        # shifted views replaces the rolling kernel + diff pair
+        vol_trend = (volume[10:] - volume[:-10]) / 10.0
+        if vol_trend.size:
+            vol_trend_strength = fabs(vol_trend.mean() / np.nanmean(vol_std))
+            vol_trend_direction = np.sign(vol_trend[-1])
+        else:
+            # Fewer than 11 bars: the rolling-mean diff this replaced was
+            # all-NaN, so keep the NaN outputs instead of indexing an
+            # empty view
+            vol_trend_strength = np.nan
+            vol_trend_direction = np.nan
+
         # Price spread analysis
-        spreads = df['high'] - df['low']
-        spread_ma = spreads.rolling(20).mean()
-        
-        # Volume by price analysis (simple version)
-        price_bins = pd.qcut(df['close'], q=5, labels=['bottom', 'low', 'mid', 'high', 'top'])
-        vol_by_price = df.groupby(price_bins)['volume'].mean()
-        
-        # Detect accumulation/distribution
-        high_vol_at_lows = (vol_by_price['bottom'] + vol_by_price['low']) / vol_by_price.mean()
-        high_vol_at_highs = (vol_by_price['top'] + vol_by_price['high']) / vol_by_price.mean()
+        spreads = features['high'] - features['low']
+        spread_ma = _safe_move_mean(spreads, 20, min_count=1)
+        
+        # Volume by price analysis (simple version): quantile edges +
+        # searchsorted binning + bincount instead of qcut/groupby
+        closes = features['close']
+        edges = np.quantile(closes, np.linspace(0.0, 1.0, 6))
+        bin_idx = np.clip(np.searchsorted(edges, closes, side='left') - 1, 0, 4)
+        vol_sums = np.bincount(bin_idx, weights=volume, minlength=5)
+        bin_counts = np.bincount(bin_idx, minlength=5)
+        vol_by_price = vol_sums / np.maximum(bin_counts, 1)
+        mean_vol_by_price = vol_by_price.mean()
+
+        # Detect accumulation/distribution (bins 0..4 = bottom..top)
+        high_vol_at_lows = (vol_by_price[0] + vol_by_price[1]) / mean_vol_by_price
+        high_vol_at_highs = (vol_by_price[4] + vol_by_price[3]) / mean_vol_by_price
         
         return {
             "vol_trend_strength": vol_trend_strength,
-            "vol_trend_direction": np.sign(vol_trend.iloc[-1]),
-            "relative_volume": rel_vol.iloc[-1],
-            "spread_ratio": spreads.iloc[-1] / spread_ma.iloc[-1],
+            "vol_trend_direction": vol_trend_direction,
+            "relative_volume": rel_vol_last,
+            "spread_ratio": spreads[-1] / spread_ma[-1],
             "high_vol_at_lows": high_vol_at_lows,
             "high_vol_at_highs": high_vol_at_highs
         }
         
-    def _detect_liquidity_levels(self, df: pd.DataFrame) -> Dict:
+    def _detect_liquidity_levels(self, df: pd.DataFrame,
+                                 features: Optional[Dict] = None) -> Dict:
         """Detect potential liquidity levels using volume and price action.
-        
+
         Returns:
             Dict with liquidity analysis
         """
+        if features is None:
+            features = self._compute_shared_features(df)
+
+        closes = features['close']
+        volumes = features['volume']
+
+        # Create price bins from quantile edges and sum volume per bin in
+        # a single bincount pass (no qcut/groupby intermediates)
+        edges = np.quantile(closes, np.linspace(0.0, 1.0, 21))
+        bin_idx = np.clip(np.searchsorted(edges, closes, side='left') - 1, 0, 19)
+        vol_by_price = np.bincount(bin_idx, weights=volumes, minlength=20)
+
         # Find high volume nodes
-        vol_profile = pd.DataFrame({
-            'price': df['close'],
-            'volume': df['volume']
-        })
-        
-        # Create price bins
-        bins = pd.qcut(vol_profile['price'], q=20)
-        vol_by_price = vol_profile.groupby(bins)['volume'].sum()
-        
-        # Find high volume nodes
-        high_vol_threshold = vol_by_price.mean() + vol_by_price.std()
-        liquidity_levels = vol_by_price[vol_by_price > high_vol_threshold]
-        
+        high_vol_threshold = vol_by_price.mean() + vol_by_price.std(ddof=1)
+        level_mask = vol_by_price > high_vol_threshold
+
         # Calculate distance to nearest liquidity level
-        current_price = df['close'].iloc[-1]
-        
-        # Get bin intervals for liquidity levels
-        distances = []
-        for bin_interval, level in liquidity_levels.items():
-            mid_price = (bin_interval.left + bin_interval.right) / 2
-            distances.append((level, abs(current_price - mid_price)))
-        
-        distances.sort(key=lambda x: x[1])
-        
+        current_price = closes[-1]
+
+        # Use bin mid-prices for the distance calculations
+        mid_prices = (edges[:-1] + edges[1:]) / 2
+        level_prices = mid_prices[level_mask]
+        level_volumes = vol_by_price[level_mask]
+
+        distances = sorted(
+            zip(level_volumes, np.abs(level_prices - current_price)),
+            key=lambda x: x[1]
+        )
+
         return {
             "nearest_liquidity": distances[0][0] if distances else 0,
             "distance_to_liquidity": distances[0][1] if distances else float('inf'),
-            "liquidity_above": any((bin_interval.left + bin_interval.right) / 2 > current_price 
-                                 for bin_interval, _ in liquidity_levels.items()),
-            "liquidity_below": any((bin_interval.left + bin_interval.right) / 2 < current_price 
-                                 for bin_interval, _ in liquidity_levels.items())
+            "liquidity_above": bool((level_prices > current_price).any()),
+            "liquidity_below": bool((level_prices < current_price).any())
         }
         
     def _detect_regime_transition(self, current_regime: MarketRegime, 
@@ -281,35 +467,37 @@ class MarketRegimeDetector:
             - details: Dict with supporting metrics
             - transitions: List of recent regime transitions
         """
+        # Extract each frame's columns once and share across the helpers
+        h_features = self._compute_shared_features(hourly_df)
+        m15_features = self._compute_shared_features(min15_df)
+
         # Get trend info from both timeframes
-        h_trend_str, h_trend_dir = self._calculate_trend_strength(hourly_df)
-        m15_trend_str, m15_trend_dir = self._calculate_trend_strength(min15_df)
-        
+        h_trend_str, h_trend_dir = self._calculate_trend_strength(hourly_df, h_features)
+        m15_trend_str, m15_trend_dir = self._calculate_trend_strength(min15_df, m15_features)
+
         # Get momentum info
-        h_mom_str, h_mom_dir = self._calculate_momentum(hourly_df)
-        m15_mom_str, m15_mom_dir = self._calculate_momentum(min15_df)
-        
+        h_mom_str, h_mom_dir = self._calculate_momentum(hourly_df, h_features)
+        m15_mom_str, m15_mom_dir = self._calculate_momentum(min15_df, m15_features)
+
         # Get volatility info
-        h_high_vol, h_vol_pct = self._detect_volatility_regime(hourly_df)
-        m15_high_vol, m15_vol_pct = self._detect_volatility_regime(min15_df)
-        
+        h_high_vol, h_vol_pct = self._detect_volatility_regime(hourly_df, h_features)
+        m15_high_vol, m15_vol_pct = self._detect_volatility_regime(min15_df, m15_features)
+
         # Get breakout info
-        h_breakout, h_break_str = self._detect_breakout(hourly_df)
-        m15_breakout, m15_break_str = self._detect_breakout(min15_df)
-        
-        # Get volume profile analysis
-        h_vol_profile = self._analyze_volume_profile(hourly_df)
-        m15_vol_profile = self._analyze_volume_profile(min15_df)
-        
-        # Get liquidity analysis
-        h_liquidity = self._detect_liquidity_levels(hourly_df)
-        m15_liquidity = self._detect_liquidity_levels(min15_df)
+        h_breakout, h_break_str = self._detect_breakout(hourly_df, h_features)
+        m15_breakout, m15_break_str = self._detect_breakout(min15_df, m15_features)
+
+        # Get volume profile and liquidity analysis; only the hourly frame
+        # feeds the regime logic and the returned details, so skip the
+        # 15-minute profile/liquidity work entirely
+        h_vol_profile = self._analyze_volume_profile(hourly_df, h_features)
+        h_liquidity = self._detect_liquidity_levels(hourly_df, h_features)
         
         # Combine metrics
         trend_strength = (h_trend_str * 0.7 + m15_trend_str * 0.3)
-        trend_direction = h_trend_dir if abs(h_trend_dir) > 0 else m15_trend_dir
+        trend_direction = h_trend_dir if fabs(h_trend_dir) > 0 else m15_trend_dir
         mom_strength = (h_mom_str * 0.7 + m15_mom_str * 0.3)
-        mom_direction = h_mom_dir if abs(h_mom_dir) > 0 else m15_mom_dir
+        mom_direction = h_mom_dir if fabs(h_mom_dir) > 0 else m15_mom_dir
         is_high_vol = h_high_vol or m15_high_vol
         vol_percentile = max(h_vol_pct, m15_vol_pct)
         is_breakout = h_breakout or m15_breakout
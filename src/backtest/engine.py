@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, time
+from math import fabs
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
@@ -45,7 +46,7 @@ class Trade:
             price_diff = self.exit_price - self.entry_price
             self.pnl = price_diff * self.position
             if self.entry_price != 0:
-                self.pnl_pct = (self.pnl / abs(self.entry_price)) * 100
+                self.pnl_pct = (self.pnl / fabs(self.entry_price)) * 100
         
     def __str__(self):
         status_str = f"{self.status}"
@@ -59,7 +60,7 @@ class Trade:
             "entry_time": self.entry_time,
             "exit_time": self.exit_time,
             "position": "LONG" if self.position > 0 else "SHORT",
-            "size": abs(self.position),
+            "size": fabs(self.position),
             "entry_price": self.entry_price,
             "exit_price": self.exit_price,
             "take_profit": self.take_profit,
@@ -135,16 +136,19 @@ class BacktestEngine:
         
         trades = []
         active_trade = None
-        
-        for timestamp in target_times:
+
+        # Prefetch all decisions with bounded concurrency; the trade
+        # simulation below stays sequential because it carries the open
+        # position from one timestamp to the next
+        self.logger.info("Fetching trading decisions...")
+        decisions = await self.bot.get_trading_decisions(target_times)
+
+        for timestamp, decision in zip(target_times, decisions):
             self.logger.info(f"\nProcessing timestamp: {timestamp}")
-            
+
             try:
-                # Get trading decision
-                self.logger.info("Fetching trading decision...")
-                decision = await self.bot.get_trading_decision(timestamp)
                 self.logger.info(f"Got decision: {decision}")
-                
+
                 # Get current price from minute data
                 self.logger.info("Fetching minute data for current price...")
                 minute_data = await self.bot.get_minute_data(timestamp, timestamp + timedelta(minutes=1))
@@ -207,7 +211,7 @@ class BacktestEngine:
                         active_trade = None
                 
                 # Open new trade if decision is not neutral
-                if abs(decision.get("position", 0)) > 0 and decision.get("confidence", 0) > 0:
+                if fabs(decision.get("position", 0)) > 0 and decision.get("confidence", 0) > 0:
                     if decision.get("take_profit") and decision.get("stop_loss"):
                         self.logger.info("Opening new trade...")
                         active_trade = Trade(
@@ -245,14 +249,31 @@ class BacktestEngine:
             print("\nNo trades executed during backtest period.")
             return
             
-        # Calculate statistics
+        # Calculate statistics in one pass instead of a filtered scan per stat
         total_trades = len(trades)
-        closed_trades = [t for t in trades if t.status != "OPEN"]
-        winning_trades = len([t for t in closed_trades if t.pnl > 0])
-        tp_hits = len([t for t in closed_trades if t.status == "TP_HIT"])
-        sl_hits = len([t for t in closed_trades if t.status == "SL_HIT"])
-        total_pnl = sum(t.pnl for t in closed_trades)
-        avg_pnl_pct = sum(t.pnl_pct for t in closed_trades) / len(closed_trades) if closed_trades else 0
+        closed_count = 0
+        winning_trades = 0
+        tp_hits = 0
+        sl_hits = 0
+        total_pnl = 0.0
+        total_pnl_pct = 0.0
+        min_pnl = float('inf')
+        max_pnl = float('-inf')
+        for t in trades:
+            if t.status == "OPEN":
+                continue
+            closed_count += 1
+            if t.pnl > 0:
+                winning_trades += 1
+            if t.status == "TP_HIT":
+                tp_hits += 1
+            elif t.status == "SL_HIT":
+                sl_hits += 1
+            total_pnl += t.pnl
+            total_pnl_pct += t.pnl_pct
+            min_pnl = min(min_pnl, t.pnl)
+            max_pnl = max(max_pnl, t.pnl)
+        avg_pnl_pct = total_pnl_pct / closed_count if closed_count else 0
         
         # Print trade list
         print("\nTrade List:")
@@ -277,12 +298,12 @@ class BacktestEngine:
         print("\nPerformance Summary:")
         print("-" * 40)
         print(f"Total Trades: {total_trades}")
-        if closed_trades:
-            win_rate = (winning_trades / len(closed_trades)) * 100
+        if closed_count:
+            win_rate = (winning_trades / closed_count) * 100
             print(f"Winning Trades: {winning_trades} ({win_rate:.1f}%)")
-            print(f"Take-Profit Hits: {tp_hits} ({(tp_hits/len(closed_trades))*100:.1f}%)")
-            print(f"Stop-Loss Hits: {sl_hits} ({(sl_hits/len(closed_trades))*100:.1f}%)")
+            print(f"Take-Profit Hits: {tp_hits} ({(tp_hits/closed_count)*100:.1f}%)")
+            print(f"Stop-Loss Hits: {sl_hits} ({(sl_hits/closed_count)*100:.1f}%)")
             print(f"Total P&L: ${total_pnl:.2f}")
             print(f"Average P&L per Trade: {avg_pnl_pct:.1f}%")
-            print(f"Max Drawdown: ${min(t.pnl for t in closed_trades):.2f}")
-            print(f"Best Trade: ${max(t.pnl for t in closed_trades):.2f}") 
\ No newline at end of file
+            print(f"Max Drawdown: ${min_pnl:.2f}")
+            print(f"Best Trade: ${max_pnl:.2f}") 
\ No newline at end of file
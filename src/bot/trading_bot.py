@@ -1,5 +1,7 @@
 from datetime import datetime
+from math import fabs
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 import asyncio
 import logging
@@ -10,8 +12,29 @@ from src.prompts.generators import PromptV0, PromptFVG, PromptRaw, PromptRawUnif
 
 class TradingBot:
     """Main trading bot class that coordinates LLM decisions with market data."""
-    
-    def __init__(self, symbol: str, data_fetcher, llm, 
+
+    # Regime-keyed adjustment tables, built once at class definition so the
+    # per-decision path doesn't rebuild the literals on every call
+    _RANGING_REGIMES = frozenset((MarketRegime.RANGING_LOW_VOL, MarketRegime.RANGING_HIGH_VOL))
+    _TRENDING_REGIMES = frozenset((MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN))
+    # Confidence boost per regime, indexed by MarketRegime.index (enum
+    # definition order) so the hot-path lookup is a single array load
+    # rather than a hash probe
+    _REGIME_CONFIDENCE_BOOST = np.array([
+        0.3,  # TRENDING_UP
+        0.3,  # TRENDING_DOWN
+        0.0,  # RANGING_LOW_VOL
+        0.0,  # RANGING_HIGH_VOL
+        0.5,  # BREAKOUT
+        0.4,  # REVERSAL
+        0.0,  # ACCUMULATION
+        0.0,  # DISTRIBUTION
+        0.0,  # MOMENTUM
+        0.0,  # EXHAUSTION
+        0.0,  # UNKNOWN
+    ])
+
+    def __init__(self, symbol: str, data_fetcher, llm,
                  max_position_size: float = 1.0,
                  min_confidence: float = 0.6,
                  min_risk_reward: float = 1.5,
@@ -67,7 +90,7 @@ class TradingBot:
         confidence = decision.get('confidence', 0)
         
         # In ranging markets, reduce position size and tighten stops
-        if regime in [MarketRegime.RANGING_LOW_VOL, MarketRegime.RANGING_HIGH_VOL]:
+        if regime in self._RANGING_REGIMES:
             decision['position'] = position * 0.7  # Reduce position size
             
             # Tighten stops in high volatility
@@ -86,13 +109,14 @@ class TradingBot:
                 decision['stop_loss'] = new_sl
                 
         # In trending markets, align with trend and potentially increase position
-        elif regime in [MarketRegime.TRENDING_UP, MarketRegime.TRENDING_DOWN]:
+        elif regime in self._TRENDING_REGIMES:
             trend_alignment = (
                 (regime == MarketRegime.TRENDING_UP and position > 0) or
                 (regime == MarketRegime.TRENDING_DOWN and position < 0)
             )
             if trend_alignment:
-                decision['confidence'] = min(1.0, confidence * (1 + regime_conf * 0.3))
+                boost = self._REGIME_CONFIDENCE_BOOST[regime.index]
+                decision['confidence'] = min(1.0, confidence * (1 + regime_conf * boost))
             else:
                 decision['confidence'] = confidence * 0.5
                 
@@ -103,7 +127,8 @@ class TradingBot:
                 (details['trend_direction'] < 0 and position < 0)
             )
             if breakout_alignment:
-                decision['confidence'] = min(1.0, confidence * (1 + regime_conf * 0.5))
+                boost = self._REGIME_CONFIDENCE_BOOST[regime.index]
+                decision['confidence'] = min(1.0, confidence * (1 + regime_conf * boost))
                 
         # In reversal regimes, increase confidence if trading against old trend
         elif regime == MarketRegime.REVERSAL:
@@ -112,7 +137,8 @@ class TradingBot:
                 (details['trend_direction'] > 0 and position < 0)
             )
             if reversal_alignment:
-                decision['confidence'] = min(1.0, confidence * (1 + regime_conf * 0.4))
+                boost = self._REGIME_CONFIDENCE_BOOST[regime.index]
+                decision['confidence'] = min(1.0, confidence * (1 + regime_conf * boost))
                 
         # Add regime info to reasoning
         decision['reasoning'] = f"Market Regime: {regime.value} (conf: {regime_conf:.2f})\n" + decision.get('reasoning', '')
@@ -128,7 +154,7 @@ class TradingBot:
         Returns:
             float: Position size (0.0 to max_position_size)
         """
-        if abs(decision.get('position', 0)) < 0.1 or decision.get('confidence', 0) < self.min_confidence:
+        if fabs(decision.get('position', 0)) < 0.1 or decision.get('confidence', 0) < self.min_confidence:
             return 0.0
             
         # Calculate risk/reward ratio
@@ -210,14 +236,17 @@ class TradingBot:
             # Scale the position by calculated size
             decision['position'] = position_size if raw_position > 0 else -position_size
             
-            # Log decision details
-            self.logger.info(
-                f"Decision: pos={decision['position']:.2f} (raw={raw_position:.2f}), "
-                f"conf={decision.get('confidence', 0):.2f}, "
-                f"tp={decision.get('take_profit', 0):.2f}, "
-                f"sl={decision.get('stop_loss', 0):.2f}, "
-                f"regime={regime_info['regime'].value}"
-            )
+            # Log decision details; guarded + lazy %-formatting so the
+            # per-decision float formatting is skipped when INFO is off
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Decision: pos=%.2f (raw=%.2f), conf=%.2f, tp=%.2f, sl=%.2f, regime=%s",
+                    decision['position'], raw_position,
+                    decision.get('confidence', 0),
+                    decision.get('take_profit', 0),
+                    decision.get('stop_loss', 0),
+                    regime_info['regime'].value
+                )
             
             return decision
             
@@ -229,6 +258,34 @@ class TradingBot:
                 "reasoning": f"Error: {str(e)}"
             }
             
+    async def get_trading_decisions(self, timestamps, max_concurrency: int = 4):
+        """Get trading decisions for a batch of timestamps.
+
+        Used in backtesting: per-timestamp decisions are independent, so
+        running them with bounded concurrency overlaps the data fetches and
+        LLM round-trips instead of paying each serially.
+
+        Note: concurrent decisions share the bot's MarketRegimeDetector, so
+        its regime_history (and the transitions reported by detect_regime)
+        records regimes in task-completion order, not timestamp order.
+        Nothing on the backtest path consumes transitions; callers that do
+        should use sequential get_trading_decision calls.
+
+        Args:
+            timestamps: Iterable of timestamps to evaluate
+            max_concurrency: Maximum number of in-flight decisions
+
+        Returns:
+            list: Trading decision dicts, in timestamp order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(timestamp):
+            async with semaphore:
+                return await self.get_trading_decision(timestamp)
+
+        return await asyncio.gather(*(bounded(ts) for ts in timestamps))
+
     async def get_minute_data(self, start_time, end_time):
         """Get 1-minute candle data between specified timestamps.
         
@@ -259,20 +316,19 @@ class TradingBot:
                 
                 # Log the decision
                 self.logger.info(
-                    f"Decision: pos={decision['position']:.2f}, "
-                    f"conf={decision['confidence']:.2f}, "
-                    f"reason={decision['reasoning']}"
+                    "Decision: pos=%.2f, conf=%.2f, reason=%s",
+                    decision['position'], decision['confidence'], decision['reasoning']
                 )
                 
                 # Check if we should take action
-                if (abs(decision["position"]) >= self.position_threshold and
+                if (fabs(decision["position"]) >= self.position_threshold and
                     decision["confidence"] >= self.min_confidence):
                     
                     # Here you would implement actual trade execution
                     self.logger.info(
                         f"Would execute trade: "
                         f"{'LONG' if decision['position'] > 0 else 'SHORT'} "
-                        f"with size {abs(decision['position']):.2f}"
+                        f"with size {fabs(decision['position']):.2f}"
                     )
                     self.current_position = decision["position"]
                 
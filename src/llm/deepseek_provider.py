@@ -1,6 +1,9 @@
-import json
 import logging
-import aiohttp
+import random
+import re
+import httpx
+import numpy as np
+import orjson
 import pandas as pd
 import platform
 import asyncio
@@ -8,9 +11,51 @@ from typing import Dict, Optional
 from .base import LLMProvider
 from src.prompts.generators import BasePromptGenerator, PromptV0, PromptFVG
 
-# Configure Windows-specific event loop policy
-if platform.system() == 'Windows':
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+def configure_windows_event_loop():
+    """Opt in to the selector event loop on Windows.
+
+    This used to run unconditionally at import, which forced the slower
+    selector loop on every caller; the default Proactor loop handles many
+    concurrent connections better. Entrypoints that still need the
+    selector loop can call this before asyncio.run().
+    """
+    if platform.system() == 'Windows':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+# Markdown code fences around the model's JSON payload, stripped in one
+# compiled-regex pass instead of chained str.replace scans
+_FENCE_RE = re.compile(r"```(?:json)?")
+
+# Transient API failures worth retrying before a decision degrades to
+# neutral; anything else surfaces immediately
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.5
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Required decision schema, built once; validation is then a subset check
+# per section instead of a fresh dict of lists and a generator per call
+_REQUIRED_SECTIONS = {
+    "daily_bias": frozenset(("direction", "confidence", "key_levels")),
+    "current_position": frozenset(("position", "confidence", "take_profit", "stop_loss")),
+    "reasoning": frozenset(("daily_context", "levels_analysis", "trend_alignment", "volume_analysis", "risk_reward"))
+}
+
+# Constant framing text for the fallback prompt, built once at import
+# instead of re-allocated per call
+_PROMPT_HEADER = (
+    "You are a professional futures trader. Analyze the following market data "
+    "and provide a trading decision.\n\n"
+    "Market Data:\n"
+)
+_PROMPT_FOOTER = (
+    "\nBased on this data, should we go long or short? Provide:\n"
+    "1. Position (-1.0 for full short to 1.0 for full long)\n"
+    "2. Confidence level (0.0 to 1.0)\n"
+    "3. Brief explanation of your reasoning\n\n"
+    "Format your response as a JSON object with keys: position, confidence, reasoning"
+)
 
 # Configure logging to ignore DEBUG from other libraries
 logging.getLogger('polygon').setLevel(logging.WARNING)
@@ -31,49 +76,98 @@ class DeepSeekProvider(LLMProvider):
         self.dry_run = dry_run
         self.prompt_generator = prompt_generator or PromptFVG()
         self.logger = logging.getLogger(__name__)
+        # Shared HTTP/2 client: concurrent calls multiplex streams over a
+        # small pool of keep-alive connections instead of opening a socket
+        # (and TLS handshake) per request
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=64),
+            headers={"Authorization": f"Bearer {self.api_key}"}
+        )
+        # Prompt cache keyed by frame identity (length + last bar per
+        # timeframe). Backtest steps share most of their history, so a
+        # repeated step with unchanged frames skips the whole prompt build.
+        # Bounded FIFO rather than lru_cache because the DataFrames
+        # themselves are unhashable.
+        self._prompt_cache: Dict[tuple, str] = {}
+        self._prompt_cache_max = 64
+        # Static request skeleton, built once; only the user message varies
+        # per call
+        self._model = "deepseek-reasoner"
+        self._system_msg = {
+            "role": "system",
+            "content": "You are a professional futures trader. You will analyze market data and provide trading decisions in JSON format with position, confidence, and reasoning fields."
+        }
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
     def _generate_prompt(self, hourly_df: pd.DataFrame, min15_df: pd.DataFrame, min5_df: pd.DataFrame, min1_df: pd.DataFrame, additional_context: dict = None) -> str:
         """Generate analysis prompt from market data."""
+        frames = [
+            (name, df)
+            for name, df in [
+                ("hourly", hourly_df),
+                ("15-minute", min15_df),
+                ("5-minute", min5_df),
+                ("1-minute", min1_df)
+            ]
+            if not df.empty
+        ]
+
+        if frames and all(len(df) >= 10 for _, df in frames):
+            # Stack the 10-bar tails into one (n_frames, 10) block so every
+            # per-timeframe stat comes out of a single vectorized pass
+            # instead of four separate trips through numpy
+            closes = np.stack([df['close'].to_numpy(dtype=np.float64)[-10:] for _, df in frames])
+            volumes = np.stack([df['volume'].to_numpy(dtype=np.float64)[-10:] for _, df in frames])
+            price_changes = (closes[:, -1] - closes[:, 0]) / closes[:, 0] * 100
+            volatilities = closes.std(axis=1, ddof=1)
+            increasing = (np.diff(volumes, axis=1) >= 0).all(axis=1)
+        else:
+            # Short frames have ragged tails; compute per frame
+            closes = [df['close'].to_numpy(dtype=np.float64)[-10:] for _, df in frames]
+            volumes = [df['volume'].to_numpy(dtype=np.float64)[-10:] for _, df in frames]
+            price_changes = [(c[-1] - c[0]) / c[0] * 100 for c in closes]
+            volatilities = [c.std(ddof=1) for c in closes]
+            increasing = [(np.diff(v) >= 0).all() for v in volumes]
+
         # Get summary stats for each timeframe
         summaries = []
-        for name, df in [
-            ("hourly", hourly_df),
-            ("15-minute", min15_df),
-            ("5-minute", min5_df),
-            ("1-minute", min1_df)
-        ]:
-            if df.empty:
-                continue
-                
-            current = df.iloc[-1]
-            recent = df.tail(10)
-            
-            price_change = ((current['close'] - recent.iloc[0]['close']) / recent.iloc[0]['close']) * 100
-            volatility = recent['close'].std()
-            volume_trend = "Increasing" if recent['volume'].is_monotonic_increasing else "Decreasing"
-            
-            summary = f"{name.capitalize()} candles:\n"
-            summary += f"Current: Open={current['open']:.2f}, High={current['high']:.2f}, Low={current['low']:.2f}, Close={current['close']:.2f}\n"
-            summary += "Recent trends:\n"
-            summary += f"- Price change last 10 periods: {price_change:.2f}%\n"
-            summary += f"- Volatility (10-period std): {volatility:.2f}\n"
-            summary += f"- Volume trend: {volume_trend}\n"
-            summaries.append(summary)
-            
-        prompt = "You are a professional futures trader. Analyze the following market data and provide a trading decision.\n\n"
-        prompt += "Market Data:\n"
-        prompt += "\n".join(f"{i+1}. Last 100 {summary}" for i, summary in enumerate(summaries))
-        
+        for i, (name, df) in enumerate(frames):
+            volume_trend = "Increasing" if increasing[i] else "Decreasing"
+
+            # Collect lines and join once; repeated str += copies the
+            # growing prompt on every append
+            summaries.append("\n".join([
+                f"{name.capitalize()} candles:",
+                f"Current: Open={df['open'].iat[-1]:.2f}, High={df['high'].iat[-1]:.2f}, Low={df['low'].iat[-1]:.2f}, Close={closes[i][-1]:.2f}",
+                "Recent trends:",
+                f"- Price change last 10 periods: {price_changes[i]:.2f}%",
+                f"- Volatility (10-period std): {volatilities[i]:.2f}",
+                f"- Volume trend: {volume_trend}",
+                ""
+            ]))
+
+        parts = [
+            _PROMPT_HEADER,
+            "\n".join(f"{i+1}. Last 100 {summary}" for i, summary in enumerate(summaries))
+        ]
+
         if additional_context:
-            prompt += f"\nAdditional Context:\n{additional_context}\n"
-            
-        prompt += "\nBased on this data, should we go long or short? Provide:\n"
-        prompt += "1. Position (-1.0 for full short to 1.0 for full long)\n"
-        prompt += "2. Confidence level (0.0 to 1.0)\n"
-        prompt += "3. Brief explanation of your reasoning\n\n"
-        prompt += "Format your response as a JSON object with keys: position, confidence, reasoning"
-        
-        return prompt
+            parts.append(f"\nAdditional Context:\n{additional_context}\n")
+
+        parts.append(_PROMPT_FOOTER)
+
+        return "".join(parts)
 
     def _format_reasoning(self, reasoning_dict: dict) -> str:
         """Format the reasoning dictionary into a readable string."""
@@ -88,22 +182,81 @@ class DeepSeekProvider(LLMProvider):
             
         return "\n".join(sections)
 
+    async def _post_with_retry(self, url: str, body: bytes) -> httpx.Response:
+        """POST with jittered exponential backoff on transient failures.
+
+        Rate limits (429) and 5xx responses are retried, honouring a
+        Retry-After header when the server sends one; transport errors are
+        retried the same way. Other responses return to the caller as-is,
+        so validation failures stay hard errors.
+        """
+        for attempt in range(_RETRY_ATTEMPTS):
+            last_attempt = attempt == _RETRY_ATTEMPTS - 1
+            delay = _RETRY_BASE_DELAY * (2 ** attempt)
+            try:
+                response = await self._client.post(url, content=body, headers=_JSON_HEADERS)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                self.logger.warning(
+                    "Transport error calling API (attempt %d/%d): %s",
+                    attempt + 1, _RETRY_ATTEMPTS, e
+                )
+            else:
+                if response.status_code not in _RETRY_STATUSES or last_attempt:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                if retry_after is not None:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                self.logger.warning(
+                    "API returned %d (attempt %d/%d)",
+                    response.status_code, attempt + 1, _RETRY_ATTEMPTS
+                )
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.25))
+
+    @staticmethod
+    def _frame_key(df: pd.DataFrame) -> tuple:
+        """Cheap identity for a timeframe DataFrame: length + last bar."""
+        if df.empty:
+            return (0, None)
+        return (len(df), df.index[-1])
+
+    def _build_prompt(self, hourly_df: pd.DataFrame, min15_df: pd.DataFrame, min5_df: pd.DataFrame, min1_df: pd.DataFrame, additional_context: Optional[Dict] = None) -> str:
+        """Generate the prompt via the configured generator, reusing the
+        cached build when all four frames are unchanged (additional_context
+        is derived from the same frames, so the key covers it)."""
+        cache_key = (
+            self._frame_key(hourly_df),
+            self._frame_key(min15_df),
+            self._frame_key(min5_df),
+            self._frame_key(min1_df)
+        )
+        prompt = self._prompt_cache.get(cache_key)
+        if prompt is None:
+            prompt = self.prompt_generator.generate(
+                hourly_df=hourly_df,
+                min15_df=min15_df,
+                min5_df=min5_df,
+                min1_df=min1_df,
+                additional_context=additional_context
+            )
+            if len(self._prompt_cache) >= self._prompt_cache_max:
+                self._prompt_cache.pop(next(iter(self._prompt_cache)))
+            self._prompt_cache[cache_key] = prompt
+        return prompt
+
     async def get_trading_decision(self, hourly_df: pd.DataFrame, min15_df: pd.DataFrame, min5_df: pd.DataFrame, min1_df: pd.DataFrame, additional_context: Optional[Dict] = None) -> Dict:
         """Get a trading decision from the model."""
-        # Generate prompt using the configured generator
-        prompt = self.prompt_generator.generate(
-            hourly_df=hourly_df,
-            min15_df=min15_df,
-            min5_df=min5_df,
-            min1_df=min1_df,
-            additional_context=additional_context
-        )
-        
-        self.logger.info("Generated prompt:")
-        self.logger.info(prompt)
-        
         if self.dry_run:
-            self.logger.info("Dry run mode - skipping API call")
+            # Nothing consumes the prompt in a dry run unless someone is
+            # reading the log, so only pay for the build in that case
+            if self.logger.isEnabledFor(logging.INFO):
+                prompt = self._build_prompt(hourly_df, min15_df, min5_df, min1_df, additional_context)
+                self.logger.info("Generated prompt:\n%s", prompt)
+                self.logger.info("Dry run mode - skipping API call")
             return {
                 "current_position": {
                     "position": 0.0,
@@ -118,138 +271,137 @@ class DeepSeekProvider(LLMProvider):
                 },
                 "reasoning": "Dry run mode - no API call made"
             }
-        
-        # Prepare API request
+
+        prompt = self._build_prompt(hourly_df, min15_df, min5_df, min1_df, additional_context)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Generated prompt:\n%s", prompt)
+
+
+        # Prepare API request (auth headers live on the shared client);
+        # serialized once with orjson so retries reuse the same bytes
         url = "https://api.deepseek.com/v1/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        payload = {
-            "model": "deepseek-reasoner",
+        body = orjson.dumps({
+            "model": self._model,
             "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a professional futures trader. You will analyze market data and provide trading decisions in JSON format with position, confidence, and reasoning fields."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        }
-        
+                self._system_msg,
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": {"type": "json_object"}
+        })
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=payload) as response:
-                    self.logger.info(f"API response status: {response.status}")
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        self.logger.error(f"API error response: {error_text}")
-                        raise ValueError(f"API request failed with status {response.status}: {error_text}")
-                    
-                    raw_response = await response.text()
-                    self.logger.info(f"Raw API response: {raw_response}")
+            # Last traded price, read once; the TP/SL validation below
+            # reuses it. An empty 1-minute frame raises here, inside the
+            # try, and degrades to the neutral error decision just as the
+            # old per-validation iloc access did
+            current_price = float(min1_df['close'].iat[-1])
+
+            response = await self._post_with_retry(url, body)
+            self.logger.info("API response status: %s", response.status_code)
+
+            if response.status_code != 200:
+                error_text = response.text
+                self.logger.error(f"API error response: {error_text}")
+                raise ValueError(f"API request failed with status {response.status_code}: {error_text}")
+
+            # Parse the body bytes directly; decoding to str is only needed
+            # for the debug log and failure branches
+            raw_bytes = response.content
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Raw API response: %s", raw_bytes.decode('utf-8', 'replace'))
+
+            try:
+                response_json = orjson.loads(raw_bytes)
+                content = response_json.get("choices", [{}])[0].get("message", {}).get("content", "")
+                
+                # response_format pins the content to a bare JSON object, so
+                # parse it directly; fall back to fence stripping and brace
+                # scanning if the model wrapped it anyway
+                try:
+                    decision = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    content = _FENCE_RE.sub("", content).strip()
+                    start = content.find("{")
+                    end = content.rfind("}") + 1
+                    if start == -1 or end == 0:
+                        raise ValueError("No JSON object found in response")
+
+                    json_str = content[start:end]
+                    self.logger.info("Cleaned content for parsing: %s", json_str)
+                    decision = orjson.loads(json_str)
+                
+                # Validate decision format first
+                for section, required_keys in _REQUIRED_SECTIONS.items():
+                    if section not in decision:
+                        raise ValueError(f"Missing required section: {section}")
+                    if not required_keys <= decision[section].keys():
+                        raise ValueError(f"Missing required keys in {section}: {sorted(required_keys - decision[section].keys())}")
+                
+                # Validate value ranges
+                daily_bias = decision["daily_bias"]
+                current_pos = decision["current_position"]
+                
+                if not -1.0 <= float(daily_bias["direction"]) <= 1.0:
+                    raise ValueError(f"Daily bias direction out of range: {daily_bias['direction']}")
+                if not 0.0 <= float(daily_bias["confidence"]) <= 1.0:
+                    raise ValueError(f"Daily bias confidence out of range: {daily_bias['confidence']}")
                     
-                    try:
-                        response_json = json.loads(raw_response)
-                        content = response_json.get("choices", [{}])[0].get("message", {}).get("content", "")
-                        
-                        # Clean up content (remove markdown code blocks if present)
-                        content = content.replace("```json", "").replace("```", "").strip()
-                        
-                        # Find the JSON object in the content
-                        start = content.find("{")
-                        end = content.rfind("}") + 1
-                        if start == -1 or end == 0:
-                            raise ValueError("No JSON object found in response")
-                        
-                        json_str = content[start:end]
-                        self.logger.info(f"Cleaned content for parsing: {json_str}")
-                        
-                        # Parse the response
-                        decision = json.loads(json_str)
-                        
-                        # Validate decision format first
-                        required_sections = {
-                            "daily_bias": ["direction", "confidence", "key_levels"],
-                            "current_position": ["position", "confidence", "take_profit", "stop_loss"],
-                            "reasoning": ["daily_context", "levels_analysis", "trend_alignment", "volume_analysis", "risk_reward"]
-                        }
-                        
-                        for section, required_keys in required_sections.items():
-                            if section not in decision:
-                                raise ValueError(f"Missing required section: {section}")
-                            if not all(key in decision[section] for key in required_keys):
-                                raise ValueError(f"Missing required keys in {section}: {required_keys}")
-                        
-                        # Validate value ranges
-                        daily_bias = decision["daily_bias"]
-                        current_pos = decision["current_position"]
-                        
-                        if not -1.0 <= float(daily_bias["direction"]) <= 1.0:
-                            raise ValueError(f"Daily bias direction out of range: {daily_bias['direction']}")
-                        if not 0.0 <= float(daily_bias["confidence"]) <= 1.0:
-                            raise ValueError(f"Daily bias confidence out of range: {daily_bias['confidence']}")
-                            
-                        if not -1.0 <= float(current_pos["position"]) <= 1.0:
-                            raise ValueError(f"Current position value out of range: {current_pos['position']}")
-                        if not 0.0 <= float(current_pos["confidence"]) <= 1.0:
-                            raise ValueError(f"Current position confidence out of range: {current_pos['confidence']}")
-                        
-                        # Validate take-profit and stop-loss are numeric
-                        try:
-                            current_pos["take_profit"] = float(current_pos["take_profit"])
-                            current_pos["stop_loss"] = float(current_pos["stop_loss"])
-                        except (ValueError, TypeError):
-                            raise ValueError("take_profit and stop_loss must be numeric values")
-                        
-                        # Validate take-profit and stop-loss make sense for the position
-                        current_price = float(min1_df.iloc[-1]['close'])
-                        if current_pos["position"] > 0:  # Long position
-                            if current_pos["take_profit"] <= current_price:
-                                raise ValueError("take_profit must be above current price for long positions")
-                            if current_pos["stop_loss"] >= current_price:
-                                raise ValueError("stop_loss must be below current price for long positions")
-                        elif current_pos["position"] < 0:  # Short position
-                            if current_pos["take_profit"] >= current_price:
-                                raise ValueError("take_profit must be below current price for short positions")
-                            if current_pos["stop_loss"] <= current_price:
-                                raise ValueError("stop_loss must be above current price for short positions")
-                        
-                        # Format the reasoning after validation
-                        reasoning_dict = decision['reasoning']
-                        formatted_reasoning = []
-                        for key, value in reasoning_dict.items():
-                            # Convert key from snake_case to Title Case
-                            title = key.replace('_', ' ').title()
-                            formatted_reasoning.append(f"{title}: {value}")
-                        
-                        # Return the decision in the format expected by the trading bot
-                        final_decision = {
-                            "current_position": {
-                                "position": float(current_pos["position"]),
-                                "confidence": float(current_pos["confidence"]),
-                                "take_profit": float(current_pos["take_profit"]),
-                                "stop_loss": float(current_pos["stop_loss"])
-                            },
-                            "daily_bias": {
-                                "direction": float(daily_bias["direction"]),
-                                "confidence": float(daily_bias["confidence"]),
-                                "key_levels": daily_bias["key_levels"]
-                            },
-                            "reasoning": "\n".join(formatted_reasoning)
-                        }
-                        
-                        self.logger.info(f"Final decision: {final_decision}")
-                        return final_decision
-                        
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"Failed to parse JSON response: {e}")
-                        self.logger.error(f"Raw response that failed to parse: {raw_response}")
-                        raise
-                        
+                if not -1.0 <= float(current_pos["position"]) <= 1.0:
+                    raise ValueError(f"Current position value out of range: {current_pos['position']}")
+                if not 0.0 <= float(current_pos["confidence"]) <= 1.0:
+                    raise ValueError(f"Current position confidence out of range: {current_pos['confidence']}")
+                
+                # Validate take-profit and stop-loss are numeric
+                try:
+                    current_pos["take_profit"] = float(current_pos["take_profit"])
+                    current_pos["stop_loss"] = float(current_pos["stop_loss"])
+                except (ValueError, TypeError):
+                    raise ValueError("take_profit and stop_loss must be numeric values")
+                
+                # Validate take-profit and stop-loss make sense for the position
+                if current_pos["position"] > 0:  # Long position
+                    if current_pos["take_profit"] <= current_price:
+                        raise ValueError("take_profit must be above current price for long positions")
+                    if current_pos["stop_loss"] >= current_price:
+                        raise ValueError("stop_loss must be below current price for long positions")
+                elif current_pos["position"] < 0:  # Short position
+                    if current_pos["take_profit"] >= current_price:
+                        raise ValueError("take_profit must be below current price for short positions")
+                    if current_pos["stop_loss"] <= current_price:
+                        raise ValueError("stop_loss must be above current price for short positions")
+                
+                # Format the reasoning after validation
+                reasoning_dict = decision['reasoning']
+                formatted_reasoning = []
+                for key, value in reasoning_dict.items():
+                    # Convert key from snake_case to Title Case
+                    title = key.replace('_', ' ').title()
+                    formatted_reasoning.append(f"{title}: {value}")
+                
+                # Return the decision in the format expected by the trading bot
+                final_decision = {
+                    "current_position": {
+                        "position": float(current_pos["position"]),
+                        "confidence": float(current_pos["confidence"]),
+                        "take_profit": float(current_pos["take_profit"]),
+                        "stop_loss": float(current_pos["stop_loss"])
+                    },
+                    "daily_bias": {
+                        "direction": float(daily_bias["direction"]),
+                        "confidence": float(daily_bias["confidence"]),
+                        "key_levels": daily_bias["key_levels"]
+                    },
+                    "reasoning": "\n".join(formatted_reasoning)
+                }
+                
+                self.logger.info("Final decision: %s", final_decision)
+                return final_decision
+                
+            except orjson.JSONDecodeError as e:
+                self.logger.error(f"Failed to parse JSON response: {e}")
+                self.logger.error(f"Raw response that failed to parse: {raw_bytes.decode('utf-8', 'replace')}")
+                raise
+
         except Exception as e:
             self.logger.error(f"Error getting trading decision: {str(e)}")
             return {
@@ -267,28 +419,43 @@ class DeepSeekProvider(LLMProvider):
                 "reasoning": f"Error getting trading decision: {str(e)}"
             }
 
+    async def get_trading_decisions(self, batches, max_concurrency: int = 8):
+        """Get trading decisions for a batch of independent inputs.
+
+        Submits up to ``max_concurrency`` requests at once so the event loop
+        overlaps the API round-trips instead of paying each serially; the
+        shared HTTP/2 client multiplexes them over one connection pool.
+
+        Args:
+            batches: Iterable of kwargs dicts for get_trading_decision
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            list: Decision dicts (or exceptions) in batch order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(batch):
+            async with semaphore:
+                return await self.get_trading_decision(**batch)
+
+        return await asyncio.gather(*(one(b) for b in batches), return_exceptions=True)
+
     async def test_api_connection(self):
         """Test the API connection with a simple request."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
-            "model": "deepseek-reasoner",
+            "model": self._model,
             "messages": [
                 {"role": "user", "content": "Hello"}
             ]
         }
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post("https://api.deepseek.com/v1/chat/completions", headers=headers, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        self.logger.error(f"API test failed: {error_text}")
-                        return False
-                    return True
+            response = await self._client.post("https://api.deepseek.com/v1/chat/completions", json=payload)
+            if response.status_code != 200:
+                self.logger.error(f"API test failed: {response.text}")
+                return False
+            return True
         except Exception as e:
             self.logger.error(f"API test failed: {str(e)}")
             return False 
\ No newline at end of file
@@ -26,16 +26,20 @@ class MockProvider(LLMProvider):
         if df.empty:
             return 0.0
             
-        df = df.copy()
-        df["sma5"] = df["close"].rolling(5).mean()
-        df["sma20"] = df["close"].rolling(20).mean()
-        df["roc"] = df["close"].pct_change(5)
-        
-        last_bar = df.iloc[-1]
-        
-        # Trend signals
-        sma_trend = 1 if last_bar["sma5"] > last_bar["sma20"] else -1
-        roc_trend = 1 if last_bar["roc"] > 0 else -1
+        # Only the last bar's values are consumed, so compute the tail
+        # averages directly instead of copying the frame and building full
+        # rolling columns (the copy also kept the caller's df untouched;
+        # reading through numpy views needs no copy at all)
+        closes = df["close"].to_numpy(dtype=np.float64)
+        n = closes.size
+        sma5 = closes[-5:].mean() if n >= 5 else np.nan
+        sma20 = closes[-20:].mean() if n >= 20 else np.nan
+        roc = closes[-1] / closes[-6] - 1.0 if n >= 6 else np.nan
+
+        # Trend signals (NaN comparisons are False, matching the rolling
+        # NaN behaviour on short frames)
+        sma_trend = 1 if sma5 > sma20 else -1
+        roc_trend = 1 if roc > 0 else -1
         
         # Combine signals
         trend = (sma_trend + roc_trend) / 2
@@ -1,7 +1,52 @@
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
+from numba import njit
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, Optional
 
+@njit(cache=True, fastmath=True)
+def _ema_last(values: np.ndarray, span: int) -> float:
+    """Last value of an exponential moving average over ``values``.
+
+    Prompt text only ever quotes the latest EMA reading, so this streams
+    the array once, carrying decayed numerator/denominator accumulators,
+    instead of materialising the whole ewm Series (or the weight vector).
+    Matches pandas ``ewm(span=span).mean().iloc[-1]``.
+    """
+    n = values.shape[0]
+    if n == 0:
+        return np.nan
+    decay = 1.0 - 2.0 / (span + 1.0)
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        num = num * decay + values[i]
+        den = den * decay + 1.0
+    return num / den
+
+def _swing_extrema_indices(highs: np.ndarray, lows: np.ndarray, window: int) -> tuple:
+    """Indices of swing highs/lows: bars strictly above (below) every high
+    (low) in the ``window`` bars on each side.
+
+    One strided window view and a max/min per side replaces the per-bar
+    neighbour comparison loop, which scanned 2*window bars per candidate.
+    """
+    n = highs.size
+    if n < 2 * window + 1:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    hw = sliding_window_view(highs, 2 * window + 1)
+    center = hw[:, window]
+    is_high = (center > hw[:, :window].max(axis=1)) & (center > hw[:, window + 1:].max(axis=1))
+
+    lw = sliding_window_view(lows, 2 * window + 1)
+    center = lw[:, window]
+    is_low = (center < lw[:, :window].min(axis=1)) & (center < lw[:, window + 1:].min(axis=1))
+
+    return np.nonzero(is_high)[0] + window, np.nonzero(is_low)[0] + window
+
 class BasePromptGenerator(ABC):
     """Base class for prompt generators."""
     
@@ -29,22 +74,23 @@ class PromptV0(BasePromptGenerator):
             if df.empty:
                 continue
                 
-            current = df.iloc[-1]
-            recent = df.tail(10)
-            
-            price_change = ((current['close'] - recent.iloc[0]['close']) / recent.iloc[0]['close']) * 100
-            volatility = recent['close'].std()
-            volume_trend = "Increasing" if recent['volume'].is_monotonic_increasing else "Decreasing"
-            
+            # Tail stats from numpy views rather than iloc/tail copies
+            closes = df['close'].to_numpy(dtype=np.float64)[-10:]
+            volumes = df['volume'].to_numpy(dtype=np.float64)[-10:]
+
+            price_change = ((closes[-1] - closes[0]) / closes[0]) * 100
+            volatility = closes.std(ddof=1)
+            volume_trend = "Increasing" if (np.diff(volumes) >= 0).all() else "Decreasing"
+
             summary = f"{name.capitalize()} candles:\n"
-            summary += f"Current: Open={current['open']:.2f}, High={current['high']:.2f}, Low={current['low']:.2f}, Close={current['close']:.2f}\n"
+            summary += f"Current: Open={df['open'].iat[-1]:.2f}, High={df['high'].iat[-1]:.2f}, Low={df['low'].iat[-1]:.2f}, Close={closes[-1]:.2f}\n"
             summary += "Recent trends:\n"
             summary += f"- Price change last 10 periods: {price_change:.2f}%\n"
             summary += f"- Volatility (10-period std): {volatility:.2f}\n"
             summary += f"- Volume trend: {volume_trend}\n"
             summaries.append(summary)
             
-        current_price = min1_df.iloc[-1]['close']
+        current_price = min1_df['close'].iat[-1]
         prompt = "You are a professional futures trader. Analyze the following market data and provide a trading decision.\n\n"
         prompt += f"Current Price: {current_price:.2f}\n\n"
         prompt += "Market Data:\n"
@@ -92,50 +138,51 @@ class PromptFVG(BasePromptGenerator):
         last_low_time = None
         last_high_price = None
         last_low_price = None
-        
-        for i in range(window, len(df) - window):
-            current_price = df.iloc[i]['high']
+
+        # Candidate swing bars come from one vectorized pass; only the few
+        # candidates go through the sequential prominence filters below
+        high_arr = df['high'].to_numpy(dtype=np.float64)
+        low_arr = df['low'].to_numpy(dtype=np.float64)
+        high_idx, low_idx = _swing_extrema_indices(high_arr, low_arr, window)
+
+        for i in high_idx:
+            current_price = high_arr[i]
             current_time = df.index[i]
-            
-            # Check if this is a swing high
-            if all(df.iloc[i]['high'] > df.iloc[i-j]['high'] for j in range(1, window+1)) and \
-               all(df.iloc[i]['high'] > df.iloc[i+j]['high'] for j in range(1, window+1)):
-                
-                # Check price distance from last high
-                if last_high_price is None or \
-                   abs(current_price - last_high_price) / last_high_price > min_price_distance_pct:
-                    
-                    # Check time distance from last high
-                    if last_high_time is None or \
-                       (current_time - last_high_time) > min_time_distance:
-                        
-                        highs.append({
-                            'timestamp': current_time,
-                            'price': current_price
-                        })
-                        last_high_time = current_time
-                        last_high_price = current_price
-            
-            current_price = df.iloc[i]['low']
-            # Check if this is a swing low
-            if all(df.iloc[i]['low'] < df.iloc[i-j]['low'] for j in range(1, window+1)) and \
-               all(df.iloc[i]['low'] < df.iloc[i+j]['low'] for j in range(1, window+1)):
-                
-                # Check price distance from last low
-                if last_low_price is None or \
-                   abs(current_price - last_low_price) / last_low_price > min_price_distance_pct:
-                    
-                    # Check time distance from last low
-                    if last_low_time is None or \
-                       (current_time - last_low_time) > min_time_distance:
-                        
-                        lows.append({
-                            'timestamp': current_time,
-                            'price': current_price
-                        })
-                        last_low_time = current_time
-                        last_low_price = current_price
-        
+
+            # Check price distance from last high
+            if last_high_price is None or \
+               abs(current_price - last_high_price) / last_high_price > min_price_distance_pct:
+
+                # Check time distance from last high
+                if last_high_time is None or \
+                   (current_time - last_high_time) > min_time_distance:
+
+                    highs.append({
+                        'timestamp': current_time,
+                        'price': current_price
+                    })
+                    last_high_time = current_time
+                    last_high_price = current_price
+
+        for i in low_idx:
+            current_price = low_arr[i]
+            current_time = df.index[i]
+
+            # Check price distance from last low
+            if last_low_price is None or \
+               abs(current_price - last_low_price) / last_low_price > min_price_distance_pct:
+
+                # Check time distance from last low
+                if last_low_time is None or \
+                   (current_time - last_low_time) > min_time_distance:
+
+                    lows.append({
+                        'timestamp': current_time,
+                        'price': current_price
+                    })
+                    last_low_time = current_time
+                    last_low_price = current_price
+
         # Convert to DataFrames
         highs_df = pd.DataFrame(highs)
         lows_df = pd.DataFrame(lows)
@@ -249,23 +296,20 @@ class PromptFVG(BasePromptGenerator):
         ]:
             if df.empty:
                 continue
-                
-            for i in range(window, len(df) - window):
-                # Check for swing high
-                if all(df.iloc[i]['high'] > df.iloc[i-j]['high'] for j in range(1, window+1)) and \
-                   all(df.iloc[i]['high'] > df.iloc[i+j]['high'] for j in range(1, window+1)):
-                    all_highs.append({
-                        'timestamp': df.iloc[i]['timestamp'],
-                        'price': df.iloc[i]['high']
-                    })
-                
-                # Check for swing low
-                if all(df.iloc[i]['low'] < df.iloc[i-j]['low'] for j in range(1, window+1)) and \
-                   all(df.iloc[i]['low'] < df.iloc[i+j]['low'] for j in range(1, window+1)):
-                    all_lows.append({
-                        'timestamp': df.iloc[i]['timestamp'],
-                        'price': df.iloc[i]['low']
-                    })
+
+            high_arr = df['high'].to_numpy(dtype=np.float64)
+            low_arr = df['low'].to_numpy(dtype=np.float64)
+            timestamps = df['timestamp']
+            high_idx, low_idx = _swing_extrema_indices(high_arr, low_arr, window)
+
+            all_highs.extend({
+                'timestamp': timestamps.iat[i],
+                'price': high_arr[i]
+            } for i in high_idx)
+            all_lows.extend({
+                'timestamp': timestamps.iat[i],
+                'price': low_arr[i]
+            } for i in low_idx)
         
         # Convert to DataFrames
         highs_df = pd.DataFrame(all_highs)
@@ -338,19 +382,30 @@ class PromptFVG(BasePromptGenerator):
         
         # Add daily bias analysis
         prompt += "Daily Market Analysis:\n"
-        current_date = min1_df.index[-1].date()
-        daily_data = hourly_df[hourly_df.index.date == current_date]
-        
-        if not daily_data.empty:
-            day_open = daily_data.iloc[0]['open']
-            day_high = daily_data['high'].max()
-            day_low = daily_data['low'].min()
+        # Bucket bars by day once via the already-datetime index (no
+        # object-dtype .date arrays) and sum daily volume in one bincount
+        day_codes, day_keys = pd.factorize(hourly_df.index.normalize())
+        current_day = min1_df.index[-1].normalize()
+
+        day_mask = None
+        if len(day_keys) > 0 and current_day in day_keys:
+            day_mask = day_codes == day_keys.get_loc(current_day)
+
+        if day_mask is not None and day_mask.any():
+            opens = hourly_df['open'].to_numpy(dtype=np.float64)
+            highs = hourly_df['high'].to_numpy(dtype=np.float64)
+            lows = hourly_df['low'].to_numpy(dtype=np.float64)
+            volumes = hourly_df['volume'].to_numpy(dtype=np.float64)
+
+            day_open = opens[int(np.argmax(day_mask))]
+            day_high = highs[day_mask].max()
+            day_low = lows[day_mask].min()
             day_change = ((current_price - day_open) / day_open) * 100
-            
-            # Calculate volume stats using timestamp-based grouping
-            day_vol = daily_data['volume'].sum()
-            daily_volumes = hourly_df.groupby(hourly_df.index.date)['volume'].sum()
-            avg_daily_vol = daily_volumes.mean() if not daily_volumes.empty else 0
+
+            # Calculate volume stats from the day buckets
+            daily_volumes = np.bincount(day_codes, weights=volumes)
+            day_vol = daily_volumes[day_keys.get_loc(current_day)]
+            avg_daily_vol = daily_volumes.mean() if daily_volumes.size > 0 else 0
             
             prompt += f"- Day Open: {day_open:.2f}\n"
             prompt += f"- Day High: {day_high:.2f}\n"
@@ -425,11 +480,11 @@ class PromptFVG(BasePromptGenerator):
         for name, df in [("Hourly", hourly_df), ("15min", min15_df), ("5min", min5_df)]:
             if df.empty:
                 continue
-            recent = df.tail(10)
-            price_change = ((recent.iloc[-1]['close'] - recent.iloc[0]['close']) / recent.iloc[0]['close']) * 100
-            ema20 = df['close'].ewm(span=20).mean().iloc[-1]
-            ema50 = df['close'].ewm(span=50).mean().iloc[-1]
-            
+            closes = df['close'].to_numpy(dtype=np.float64)
+            price_change = ((closes[-1] - closes[-10]) / closes[-10]) * 100 if closes.size >= 10 else ((closes[-1] - closes[0]) / closes[0]) * 100
+            ema20 = _ema_last(closes, 20)
+            ema50 = _ema_last(closes, 50)
+
             trend = "Bullish" if ema20 > ema50 else "Bearish"
             prompt += f"\n{name} Timeframe:\n"
             prompt += f"- Price change last 10 periods: {price_change:+.2f}%\n"